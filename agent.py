@@ -1,11 +1,43 @@
 # agent.py
 # Core agent functionality for WhatsApp Birthday AI Agent
 
-from langchain_openai import ChatOpenAI
-from langgraph.prebuilt import create_react_agent
-from config import OPENAI_API_KEY, MODEL_NAME, TEMPERATURE
-from tools import TOOLS
-from prompts import SYSTEM_PROMPT
+import asyncio
+from functools import lru_cache
+from typing import Iterator, List, Optional
+from langchain_core.messages import AIMessage, BaseMessage
+from config import (
+    OPENAI_API_KEY,
+    MODEL_NAME,
+    TEMPERATURE,
+    DATE_SEARCH_RE,
+    WELCOME_MESSAGE,
+    FAST_PATH_MAX_LENGTH
+)
+from tools import get_tools, check_birthday
+from prompts import SYSTEM_MESSAGE
+
+@lru_cache(maxsize=1)
+def _get_llm():
+    """
+    Get the shared language model instance.
+    
+    Returns:
+        ChatOpenAI: Model shared by all agents so they reuse one HTTP connection pool
+    """
+    # Imported lazily: langchain_openai pulls in the OpenAI SDK and httpx
+    import httpx
+    from langchain_openai import ChatOpenAI
+    
+    # HTTP/2 lets concurrent requests multiplex over one warm TLS connection
+    limits = httpx.Limits(max_connections=32)
+    
+    return ChatOpenAI(
+        model=MODEL_NAME,
+        temperature=TEMPERATURE,
+        api_key=OPENAI_API_KEY,
+        http_client=httpx.Client(http2=True, limits=limits),
+        http_async_client=httpx.AsyncClient(http2=True, limits=limits)
+    )
 
 class WhatsAppBirthdayAgent:
     """
@@ -17,26 +49,90 @@ class WhatsAppBirthdayAgent:
         """Initialize the birthday agent with LLM and tools."""
         self.llm = None
         self.agent = None
+        self._date_re = DATE_SEARCH_RE
         self._setup_agent()
     
     def _setup_agent(self):
         """
         Set up the LangGraph ReAct agent with ChatOpenAI model and tools.
         """
-        # Initialize the language model
-        self.llm = ChatOpenAI(
-            model=MODEL_NAME,
-            temperature=TEMPERATURE,
-            api_key=OPENAI_API_KEY
-        )
+        # Imported lazily so importing this module stays cheap
+        from langgraph.prebuilt import create_react_agent
         
-        # Create the ReAct agent with LangGraph
+        # Reuse the shared language model
+        self.llm = _get_llm()
+        
+        # Create the ReAct agent with LangGraph. Each message is a stateless,
+        # single-turn check, so no checkpointer (and no thread_id) is used.
         self.agent = create_react_agent(
             model=self.llm,
-            tools=TOOLS,
-            prompt=SYSTEM_PROMPT,
+            tools=get_tools(),
+            prompt=SYSTEM_MESSAGE,
+            checkpointer=None,
         )
     
+    def _fast_path_response(self, user_message: str) -> Optional[str]:
+        """
+        Answer trivial messages deterministically without calling the LLM.
+        
+        Args:
+            user_message (str): User's input message
+            
+        Returns:
+            Optional[str]: Response if the message could be handled directly,
+            None if it needs to go through the agent
+        """
+        # A DD-MM-YYYY date anywhere in the message goes straight to the tool
+        match = self._date_re.search(user_message)
+        if match:
+            return check_birthday(match.group(0))
+        
+        # Short messages without any digits, such as greetings, never contain a DOB
+        text = user_message.strip()
+        if len(text) < FAST_PATH_MAX_LENGTH and not any(char.isdigit() for char in text):
+            return WELCOME_MESSAGE
+        
+        return None
+    
+    def _message_text(self, message: BaseMessage) -> str:
+        """
+        Get the text of a message or message chunk.
+        
+        Args:
+            message (BaseMessage): Message from the LangGraph agent
+            
+        Returns:
+            str: Message text, empty if it has none
+        """
+        content = getattr(message, "content", "")
+        
+        # Multimodal models may return a list of content parts
+        if isinstance(content, list):
+            content = "".join(
+                part.get("text", "") if isinstance(part, dict) else str(part)
+                for part in content
+            )
+        
+        return content if isinstance(content, str) else ""
+    
+    def _extract_response(self, response: dict) -> str:
+        """
+        Extract the final reply text from an agent response.
+        
+        Args:
+            response (dict): State returned by the LangGraph agent
+            
+        Returns:
+            str: Agent's response text
+        """
+        # The final AI reply is always the last message of a ReAct run
+        content = self._message_text(response["messages"][-1])
+        
+        if content.strip():
+            return content.strip()
+        
+        return "Sorry, I couldn't process that message."
+    
     def process_message(self, user_message: str) -> str:
         """
         Process user message through the agent and return response.
@@ -48,24 +144,98 @@ class WhatsAppBirthdayAgent:
             str: Agent's response
         """
         try:
+            # Skip the LLM round-trip for messages we can answer directly
+            fast_response = self._fast_path_response(user_message)
+            if fast_response is not None:
+                return fast_response
+            
             # Invoke the agent with the user's message
             response = self.agent.invoke({
                 "messages": [("user", user_message)]
             })
             
-            # Extract the agent's response from the messages
-            agent_messages = response["messages"]
+            return self._extract_response(response)
+            
+        except Exception as e:
+            return f"Error: {str(e)}"
+    
+    def stream_message(self, user_message: str) -> Iterator[str]:
+        """
+        Process user message through the agent, yielding the reply as it is generated.
+        
+        Args:
+            user_message (str): User's input message
+            
+        Yields:
+            str: Pieces of the agent's response
+        """
+        try:
+            # Messages we can answer directly arrive as a single piece
+            fast_response = self._fast_path_response(user_message)
+            if fast_response is not None:
+                yield fast_response
+                return
+            
+            # Stream the model's reply: tokens as they arrive, or the whole
+            # message from models that don't stream. Tool results and turns
+            # that call a tool aren't part of the reply.
+            for message, metadata in self.agent.stream(
+                {"messages": [("user", user_message)]},
+                stream_mode="messages"
+            ):
+                if metadata.get("langgraph_node") != "agent" or not isinstance(message, AIMessage):
+                    continue
+                if message.tool_calls or getattr(message, "tool_call_chunks", None):
+                    continue
+                
+                text = self._message_text(message)
+                if text:
+                    yield text
+            
+        except Exception as e:
+            yield f"Error: {str(e)}"
+    
+    async def aprocess_message(self, user_message: str) -> str:
+        """
+        Asynchronously process user message through the agent.
+        
+        Args:
+            user_message (str): User's input message
+            
+        Returns:
+            str: Agent's response
+        """
+        try:
+            # Skip the LLM round-trip for messages we can answer directly
+            fast_response = self._fast_path_response(user_message)
+            if fast_response is not None:
+                return fast_response
             
-            # Get the last message from the agent (should be the response)
-            for message in reversed(agent_messages):
-                if hasattr(message, 'content') and message.content.strip():
-                    return message.content.strip()
+            # Invoke the agent without blocking the event loop
+            response = await self.agent.ainvoke({
+                "messages": [("user", user_message)]
+            })
             
-            return "Sorry, I couldn't process that message."
+            return self._extract_response(response)
             
         except Exception as e:
             return f"Error: {str(e)}"
     
+    async def process_batch(self, user_messages: List[str]) -> List[str]:
+        """
+        Process several messages concurrently.
+        
+        Args:
+            user_messages (List[str]): User input messages
+            
+        Returns:
+            List[str]: Agent responses in the same order as the input
+        """
+        return await asyncio.gather(
+            *(self.aprocess_message(message) for message in user_messages),
+            return_exceptions=True
+        )
+    
     def get_agent(self):
         """
         Get the underlying agent instance.
@@ -75,10 +245,13 @@ class WhatsAppBirthdayAgent:
         """
         return self.agent
 
+@lru_cache(maxsize=1)
 def create_birthday_agent():
     """
     Factory function to create a WhatsApp Birthday Agent.
     
+    The agent is built once per process; later calls return the same instance.
+    
     Returns:
         WhatsAppBirthdayAgent: Configured birthday agent instance
     """
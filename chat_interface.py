@@ -52,10 +52,16 @@ class ChatInterface:
         if not user_input:
             return True
         
-        # Process message through agent
-        print("🤖 Agent: Processing...")
-        response = self.agent.process_message(user_input)
-        print(f"🤖 Agent: {response}\n")
+        # Stream the agent's reply as it is generated
+        print("🤖 Agent: ", end="", flush=True)
+        received_reply = False
+        for chunk in self.agent.stream_message(user_input):
+            print(chunk, end="", flush=True)
+            received_reply = True
+        
+        if not received_reply:
+            print("Sorry, I couldn't process that message.", end="")
+        print("\n")
         
         return True
     
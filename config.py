@@ -2,6 +2,7 @@
 # Configuration settings for WhatsApp Birthday AI Agent
 
 import os
+import re
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -18,10 +19,16 @@ TEMPERATURE = 0.1  # Low temperature for consistent responses
 DATE_FORMAT = "%d-%m-%Y"  # DD-MM-YYYY format
 DATE_PATTERN = r'^\d{1,2}-\d{1,2}-\d{4}$'  # Regex pattern for DD-MM-YYYY
 DATE_EXAMPLE = "25-12-1997"
+DATE_RE = re.compile(DATE_PATTERN)  # Full-string DD-MM-YYYY check
+DATE_SEARCH_RE = re.compile(r'(?<!\d)\d{1,2}-\d{1,2}-\d{4}(?!\d)')  # Finds a standalone DD-MM-YYYY date anywhere in a message
 
 # ===== MESSAGES CONFIGURATION =====
 WELCOME_MESSAGE = "Welcome! Please input your date of birth in DD-MM-YYYY format (day-month-year). Example: 25-12-1997"
 FORMAT_ERROR_MESSAGE = "Please provide date in DD-MM-YYYY format (day-month-year). Example: 25-12-1997"
 BIRTHDAY_MESSAGE = "Happy Birthday 🎉"
 NOT_BIRTHDAY_MESSAGE = "Not your birthday today"
-INVALID_DATE_MESSAGE = "Invalid date. Please use DD-MM-YYYY format (day-month-year). Example: 25-12-1997"
\ No newline at end of file
+INVALID_DATE_MESSAGE = "Invalid date. Please use DD-MM-YYYY format (day-month-year). Example: 25-12-1997"
+
+# ===== FAST PATH CONFIGURATION =====
+# Messages without any digits that are shorter than this are answered without the LLM
+FAST_PATH_MAX_LENGTH = 40
\ No newline at end of file
@@ -1,15 +1,24 @@
 # examples.py
 # Example usage and testing for WhatsApp Birthday AI Agent
 
-from datetime import datetime
+import asyncio
+from datetime import date
 from agent import create_birthday_agent
-from config import WELCOME_MESSAGE
+from config import WELCOME_MESSAGE, DATE_FORMAT
+
+SEPARATOR = "-" * 60
 
 def run_examples():
     """
     Example usage of the WhatsApp Birthday AI Agent.
     Shows how to integrate with actual WhatsApp API or messaging service.
     """
+    asyncio.run(_run_examples_async())
+
+async def _run_examples_async():
+    """
+    Send all example messages to the agent concurrently and print the results.
+    """
     print("🧪 WhatsApp Birthday AI Agent - Example Usage")
     print("=" * 60)
     
@@ -20,7 +29,7 @@ def run_examples():
     test_messages = [
         "Hello!",
         "My birthday is 25-12-1990",
-        f"I was born on {datetime.now().strftime('%d-%m-%Y')}",  # Today's date in DD-MM-YYYY
+        f"I was born on {date.today().strftime(DATE_FORMAT)}",  # Today's date in DD-MM-YYYY
         "Born on 15-01-1995",
         "My DOB is 12/25/1990",  # Wrong format
         "25-13-1995",  # Invalid date (month 13)
@@ -30,15 +39,16 @@ def run_examples():
     
     # Show welcome message first
     print(f"🤖 Agent: {WELCOME_MESSAGE}")
-    print("-" * 60)
+    print(SEPARATOR)
+    
+    # Process all test messages concurrently
+    responses = await agent.process_batch(test_messages)
     
-    # Process each test message
-    for i, msg in enumerate(test_messages, 1):
+    for i, (msg, response) in enumerate(zip(test_messages, responses), 1):
         print(f"Test {i}:")
         print(f"User: {msg}")
-        response = agent.process_message(msg)
         print(f"Agent: {response}")
-        print("-" * 60)
+        print(SEPARATOR)
 
 def test_birthday_scenarios():
     """
@@ -48,13 +58,13 @@ def test_birthday_scenarios():
     print("=" * 40)
     
     agent = create_birthday_agent()
-    today = datetime.now()
+    today = date.today()
     
     # Test cases
     test_cases = [
         {
             "name": "Today's Birthday",
-            "date": today.strftime('%d-%m-%Y'),
+            "date": today.strftime(DATE_FORMAT),
             "expected": "Happy Birthday 🎉"
         },
         {
@@ -96,7 +106,7 @@ def integration_example():
     # This is how you would integrate with WhatsApp API
     agent = create_birthday_agent()
     
-    def handle_whatsapp_message(phone_number: str, message: str) -> str:
+    async def handle_whatsapp_message(phone_number: str, message: str) -> str:
         """
         Handle incoming WhatsApp message.
         
@@ -108,7 +118,7 @@ def integration_example():
             str: Response to send back
         """
         # Process message through birthday agent
-        response = agent.process_message(message)
+        response = await agent.aprocess_message(message)
         
         # Log the interaction (in real app, use proper logging)
         print(f"User {phone_number}: {message}")
@@ -120,12 +130,18 @@ def integration_example():
     example_interactions = [
         ("+1234567890", "Hello!"),
         ("+1234567890", "My birthday is 15-08-1995"),
-        ("+9876543210", f"Born on {datetime.now().strftime('%d-%m-%Y')}"),
+        ("+9876543210", f"Born on {date.today().strftime(DATE_FORMAT)}"),
     ]
     
+    async def handle_all():
+        # A webhook server would await these as messages arrive
+        return await asyncio.gather(
+            *(handle_whatsapp_message(phone, message) for phone, message in example_interactions)
+        )
+    
     print("WhatsApp Integration Example:")
-    for phone, message in example_interactions:
-        response = handle_whatsapp_message(phone, message)
+    responses = asyncio.run(handle_all())
+    for (phone, _), response in zip(example_interactions, responses):
         print(f"→ Sent to {phone}: {response}\n")
 
 if __name__ == "__main__":
@@ -18,8 +18,9 @@ Version: 1.0
 
 import sys
 import argparse
-from chat_interface import main as run_chat
-from examples import run_examples, test_birthday_scenarios, integration_example
+
+# The agent modules import LangChain/LangGraph, so they are only loaded by the
+# modes that need them; help output stays fast.
 
 def display_help():
     """Display help information about the application."""
@@ -51,7 +52,7 @@ User: "My birthday is 25-12-1997" → Agent checks if today is Dec 25th
 User: "04-09-2025" → Agent: "Happy Birthday 🎉" (if today is Sep 4th)
 
 REQUIREMENTS:
-- Python 3.8+
+- Python 3.10+
 - langchain-openai
 - langgraph  
 - OpenAI API key
@@ -105,12 +106,15 @@ def main():
             display_help()
         
         elif args.examples:
+            from examples import run_examples
             run_examples()
         
         elif args.test:
+            from examples import test_birthday_scenarios
             test_birthday_scenarios()
         
         elif args.integration:
+            from examples import integration_example
             integration_example()
         
         else:
@@ -118,6 +122,7 @@ def main():
             print("🚀 Starting WhatsApp Birthday AI Agent...")
             print("💡 Tip: Use --examples to see usage examples")
             print("💡 Tip: Use --help for more options\n")
+            from chat_interface import main as run_chat
             run_chat()
     
     except KeyboardInterrupt:
@@ -0,0 +1,11 @@
+"""
+Vedic astrology planetary position calculator.
+"""
+
+from planetary_calculator.planetary_position_calculator import (
+    PositionResult,
+    calculate_planetary_positions,
+    calculate_planetary_positions_batch
+)
+
+__all__ = ["PositionResult", "calculate_planetary_positions", "calculate_planetary_positions_batch"]
@@ -3,11 +3,82 @@ Utility functions for formatting astrological data and positions.
 Provides consistent formatting for planetary positions and calculations.
 """
 
-from typing import List
+import os
+import numpy as np
+from functools import wraps
+from typing import Callable, List, Sequence, Tuple
+
+def _lazy_njit(func: Callable) -> Callable:
+    """
+    Compile func with Numba on its first call instead of at import time.
+    
+    Importing numba takes a noticeable fraction of a second, so it is only
+    paid once a kernel is actually used. Numba is optional; without it the
+    kernels run as plain NumPy.
+    
+    Args:
+        func (Callable): Kernel to compile
+        
+    Returns:
+        Callable: Wrapper that dispatches to the compiled kernel
+    """
+    compiled = None
+    
+    @wraps(func)
+    def wrapper(*args):
+        nonlocal compiled
+        if compiled is None:
+            try:
+                from numba import njit
+                compiled = njit(cache=True)(func)
+            except ImportError:
+                compiled = func
+        return compiled(*args)
+    
+    return wrapper
+
+# Per-call JIT dispatch only pays off over many calls, so the scalar kernel is opt-in
+_USE_SCALAR_JIT = os.environ.get("NUMBA_ENABLE", "").lower() in ("1", "true", "yes")
+
+@_lazy_njit
+def _lon_to_dms(longitude: float) -> Tuple[int, int, int, int]:
+    """
+    Split a longitude into zodiac sign index, degrees, arcminutes and arcseconds.
+    
+    Args:
+        longitude (float): Longitude in degrees (0-360)
+        
+    Returns:
+        Tuple[int, int, int, int]: Sign index (0-11), degrees (0-29), minutes and seconds
+    """
+    sign = int(longitude // 30.0)
+    remainder = longitude - sign * 30.0
+    degrees = int(remainder)
+    minutes_float = (remainder - degrees) * 60.0
+    minutes = int(minutes_float)
+    seconds = int((minutes_float - minutes) * 60.0)
+    return sign, degrees, minutes, seconds
+
+@_lazy_njit
+def _normalize_and_bucket(longitudes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split longitudes into degrees within the sign and zodiac sign index.
+    
+    Args:
+        longitudes (np.ndarray): Longitudes in degrees (0-360)
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Degrees within the sign (0-30) and sign indices (0-11)
+    """
+    degrees_in_sign = longitudes % 30.0
+    sign_indices = (longitudes // 30.0).astype(np.int64)
+    return degrees_in_sign, sign_indices
 
 class PositionFormatter:
     """Handles formatting of planetary positions into readable strings."""
     
+    __slots__ = ("zodiac_signs", "_zodiac_sign_array")
+    
     def __init__(self, zodiac_signs: List[str]):
         """
         Initialize formatter with zodiac signs.
@@ -16,6 +87,7 @@ class PositionFormatter:
             zodiac_signs (List[str]): List of 12 zodiac signs in order
         """
         self.zodiac_signs = zodiac_signs
+        self._zodiac_sign_array = np.array(zodiac_signs)
     
     def format_position(self, celestial_body_name: str, longitude_degrees: float) -> str:
         """
@@ -31,22 +103,89 @@ class PositionFormatter:
         Example:
             "Sun      : 054° 23' → 24° 23' Taurus"
         """
-        # Determine which zodiac sign (each sign is 30 degrees)
-        sign_index = int(longitude_degrees // 30)
+        # Split into zodiac sign (each sign is 30 degrees), degrees (0-29) and minutes
+        if _USE_SCALAR_JIT:
+            sign_index, degrees, minutes, _ = _lon_to_dms(longitude_degrees)
+        else:
+            sign_index, degrees_in_sign = divmod(longitude_degrees, 30.0)
+            degrees, fraction = divmod(degrees_in_sign, 1.0)
+            sign_index, degrees = int(sign_index), int(degrees)
+            minutes = int(fraction * 60)
         zodiac_sign = self.zodiac_signs[sign_index]
         
-        # Calculate degrees within the sign (0-29)
-        degrees_in_sign = longitude_degrees % 30
-        degrees = int(degrees_in_sign)
-        minutes = int((degrees_in_sign - degrees) * 60)
-        
         # Format with consistent spacing for alignment
         return (
             f"{celestial_body_name:9}: "
-            f"{longitude_degrees:05.0f}° {minutes:02d}' → "
+            f"{sign_index * 30 + degrees:03d}° {minutes:02d}' → "
             f"{degrees:02d}° {minutes:02d}' {zodiac_sign}"
         )
     
+    def format_positions(self, celestial_body_names: Sequence[str], longitudes: Sequence[float]) -> List[str]:
+        """
+        Format several celestial bodies' positions for one chart.
+        
+        A single chart is only a handful of bodies, so the scalar arithmetic of
+        format_position is cheaper than dispatching to the array kernel.
+        
+        Args:
+            celestial_body_names (Sequence[str]): Names of the planets/points
+            longitudes (Sequence[float]): Longitudes in degrees (0-360), same order as names
+            
+        Returns:
+            List[str]: Formatted position strings
+        """
+        format_position = self.format_position
+        longitudes = np.asarray(longitudes, dtype=np.float64).tolist()
+        return [
+            format_position(name, longitude)
+            for name, longitude in zip(celestial_body_names, longitudes)
+        ]
+    
+    def format_position_table(
+        self,
+        celestial_body_names: Sequence[str],
+        longitude_table: np.ndarray
+    ) -> List[List[str]]:
+        """
+        Format positions for many charts at once.
+        
+        Args:
+            celestial_body_names (Sequence[str]): Names of the planets/points (one per column)
+            longitude_table (np.ndarray): Longitudes in degrees (0-360), shape (charts, bodies)
+            
+        Returns:
+            List[List[str]]: Formatted position strings for each chart
+        """
+        longitude_table = np.ascontiguousarray(longitude_table, dtype=np.float64)
+        
+        # The array kernel only pays for itself across several charts
+        if longitude_table.shape[0] < 2:
+            return [self.format_positions(celestial_body_names, row) for row in longitude_table]
+        
+        degrees_in_sign, sign_indices = _normalize_and_bucket(longitude_table)
+        degrees, fractions = np.divmod(degrees_in_sign, 1.0)
+        degrees = degrees.astype(np.int64)
+        minutes = (fractions * 60).astype(np.int64)
+        total_degrees = sign_indices * 30 + degrees
+        zodiac_signs = self._zodiac_sign_array[sign_indices]
+        
+        return [
+            [
+                f"{name:9}: "
+                f"{total_degree:03d}° {minute:02d}' → "
+                f"{degree:02d}° {minute:02d}' {sign}"
+                for name, total_degree, degree, minute, sign in zip(
+                    celestial_body_names, total_row, degree_row, minute_row, sign_row
+                )
+            ]
+            for total_row, degree_row, minute_row, sign_row in zip(
+                total_degrees.tolist(),
+                degrees.tolist(),
+                minutes.tolist(),
+                zodiac_signs.tolist()
+            )
+        ]
+    
     def format_coordinates(self, latitude: float, longitude: float) -> str:
         """
         Format geographic coordinates for display.
@@ -58,7 +197,34 @@ class PositionFormatter:
         Returns:
             str: Formatted coordinate string
         """
-        lat_dir = "N" if latitude >= 0 else "S"
-        lon_dir = "E" if longitude >= 0 else "W"
+        lat_dir = "NS"[latitude < 0]
+        lon_dir = "EW"[longitude < 0]
+        
+        return f"{abs(latitude):.4f}°{lat_dir}, {abs(longitude):.4f}°{lon_dir}"
+    
+    def format_coordinates_batch(self, latitudes: Sequence[float], longitudes: Sequence[float]) -> List[str]:
+        """
+        Format several geographic coordinate pairs for display.
+        
+        Args:
+            latitudes (Sequence[float]): Latitudes in degrees
+            longitudes (Sequence[float]): Longitudes in degrees, same order as latitudes
+            
+        Returns:
+            List[str]: Formatted coordinate strings
+        """
+        latitude_array = np.asarray(latitudes, dtype=np.float64)
+        longitude_array = np.asarray(longitudes, dtype=np.float64)
+        
+        lat_dirs = np.where(latitude_array < 0, "S", "N")
+        lon_dirs = np.where(longitude_array < 0, "W", "E")
         
-        return f"{abs(latitude):.4f}°{lat_dir}, {abs(longitude):.4f}°{lon_dir}"
\ No newline at end of file
+        return [
+            f"{lat:.4f}°{lat_dir}, {lon:.4f}°{lon_dir}"
+            for lat, lat_dir, lon, lon_dir in zip(
+                np.abs(latitude_array).tolist(),
+                lat_dirs.tolist(),
+                np.abs(longitude_array).tolist(),
+                lon_dirs.tolist()
+            )
+        ]
\ No newline at end of file
@@ -3,9 +3,40 @@ Location resolution service for converting place names to geographic coordinates
 Uses OpenStreetMap's Nominatim API for geocoding.
 """
 
+import asyncio
+import os
+import sqlite3
+import threading
 import requests
 import time
-from typing import Optional, Tuple
+from collections import OrderedDict
+from requests.adapters import HTTPAdapter
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import httpx
+
+@lru_cache(maxsize=None)
+def _connect_cache(cache_path: str) -> sqlite3.Connection:
+    """
+    Open the on-disk geocoding cache, creating it if needed.
+    
+    One connection per database file is shared by all resolvers in the process.
+    
+    Args:
+        cache_path (str): Path to the SQLite database
+        
+    Returns:
+        sqlite3.Connection: Connection to the cache database
+    """
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    connection = sqlite3.connect(cache_path, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS geocache (key TEXT PRIMARY KEY, lat REAL, lon REAL)"
+    )
+    return connection
 
 class LocationResolver:
     """
@@ -22,12 +53,28 @@ class LocationResolver:
             'User-Agent': 'VedicAstrologyCalculator/2.0 (Educational Purpose)'
         }
         self.request_delay = 1.0  # Respectful delay between API requests
+        self._last_request_time = 0.0
+        self._rate_limit_lock = threading.Lock()
+        self._async_rate_limit_lock: Optional[asyncio.Lock] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Reuse one keep-alive session so fallback queries skip new TCP/TLS handshakes
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+        self._async_client: Optional["httpx.AsyncClient"] = None  # Created per event loop on first async use
+        
+        # Resolved locations are cached in memory and on disk across runs
+        self.cache_path = os.path.expanduser("~/.cache/nominatim.sqlite3")
+        self.memory_cache_size = 1024
+        self._memory_cache: OrderedDict[str, Tuple[float, float]] = OrderedDict()
     
     def get_coordinates(
         self,
         district: str,
         state: str,
-        country: str
+        country: str,
+        manual_fallback: bool = True
     ) -> Optional[Tuple[float, float]]:
         """
         Resolve location name to coordinates.
@@ -36,26 +83,217 @@ class LocationResolver:
             district (str): District or city name
             state (str): State or province name  
             country (str): Country name
+            manual_fallback (bool, optional): Prompt for coordinates on stdin if
+                every lookup fails. Defaults to True
             
         Returns:
             Optional[Tuple[float, float]]: (latitude, longitude) if found, None if failed
         """
-        # Try different search queries in order of specificity
-        search_queries = [
-            f"{district}, {state}, {country}",  # Most specific
-            f"{district}, {country}",           # Skip state if needed
-            f"{state}, {country}"               # Fallback to state level
-        ]
+        cache_key = self._cache_key(district, state, country)
         
-        for query in search_queries:
+        # Cache hits skip both the network round-trip and the rate-limit delay
+        coordinates = self._cached_coordinates(cache_key)
+        if coordinates:
+            return coordinates
+        
+        for query in self._search_queries(district, state, country):
             coordinates = self._query_nominatim(query)
             if coordinates:
                 print(f"✅ Location resolved: {query} → {coordinates[0]:.4f}°, {coordinates[1]:.4f}°")
+                self._remember(cache_key, coordinates)
+                self._write_disk_cache(cache_key, coordinates)
                 return coordinates
         
         # If all automated attempts fail, try manual input
         print(f"❌ Could not resolve location: {district}, {state}, {country}")
-        return self._get_manual_coordinates()
+        return self._get_manual_coordinates() if manual_fallback else None
+    
+    async def aget_coordinates(
+        self,
+        district: str,
+        state: str,
+        country: str
+    ) -> Optional[Tuple[float, float]]:
+        """
+        Asynchronously resolve location name to coordinates.
+        
+        Mirrors get_coordinates, but never falls back to manual input since
+        blocking on input() would stall every other lookup on the event loop.
+        
+        Args:
+            district (str): District or city name
+            state (str): State or province name  
+            country (str): Country name
+            
+        Returns:
+            Optional[Tuple[float, float]]: (latitude, longitude) if found, None if failed
+        """
+        cache_key = self._cache_key(district, state, country)
+        
+        # Cache hits skip both the network round-trip and the rate-limit delay
+        coordinates = self._cached_coordinates(cache_key)
+        if coordinates:
+            return coordinates
+        
+        for query in self._search_queries(district, state, country):
+            coordinates = await self._aquery_nominatim(query)
+            if coordinates:
+                print(f"✅ Location resolved: {query} → {coordinates[0]:.4f}°, {coordinates[1]:.4f}°")
+                self._remember(cache_key, coordinates)
+                self._write_disk_cache(cache_key, coordinates)
+                return coordinates
+        
+        print(f"❌ Could not resolve location: {district}, {state}, {country}")
+        return None
+    
+    async def aresolve_many(
+        self,
+        locations: Iterable[Tuple[str, str, str]]
+    ) -> List[Optional[Tuple[float, float]]]:
+        """
+        Resolve several locations concurrently.
+        
+        Cached locations return immediately while network lookups share one
+        connection and stay within the Nominatim rate limit.
+        
+        Args:
+            locations (Iterable[Tuple[str, str, str]]): (district, state, country) triples
+            
+        Returns:
+            List[Optional[Tuple[float, float]]]: Coordinates in the same order as the input
+        """
+        locations = list(locations)
+        
+        # Resolve each distinct location only once
+        unique_locations = list(dict.fromkeys(locations))
+        resolved = await asyncio.gather(
+            *(self.aget_coordinates(*location) for location in unique_locations)
+        )
+        coordinates_by_location = dict(zip(unique_locations, resolved))
+        
+        return [coordinates_by_location[location] for location in locations]
+    
+    async def aclose(self) -> None:
+        """Close the async HTTP client if one was created."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_loop = None
+    
+    def _search_queries(self, district: str, state: str, country: str) -> List[str]:
+        """
+        Build search queries in order of specificity.
+        
+        Args:
+            district (str): District or city name
+            state (str): State or province name  
+            country (str): Country name
+            
+        Returns:
+            List[str]: Queries to try in order
+        """
+        return [
+            f"{district}, {state}, {country}",  # Most specific
+            f"{district}, {country}",           # Skip state if needed
+            f"{state}, {country}"               # Fallback to state level
+        ]
+    
+    def _cached_coordinates(self, cache_key: str) -> Optional[Tuple[float, float]]:
+        """
+        Look up coordinates in the in-memory cache, then in the on-disk cache.
+        
+        Args:
+            cache_key (str): Location cache key
+            
+        Returns:
+            Optional[Tuple[float, float]]: Cached coordinates if present
+        """
+        coordinates = self._memory_cache.get(cache_key)
+        if coordinates:
+            self._memory_cache.move_to_end(cache_key)
+            return coordinates
+        
+        coordinates = self._read_disk_cache(cache_key)
+        if coordinates:
+            self._remember(cache_key, coordinates)
+        return coordinates
+    
+    def _remember(self, cache_key: str, coordinates: Tuple[float, float]) -> None:
+        """
+        Store coordinates in the in-memory cache, evicting the least recently used entry when full.
+        
+        Args:
+            cache_key (str): Location cache key
+            coordinates (Tuple[float, float]): (latitude, longitude)
+        """
+        self._memory_cache[cache_key] = coordinates
+        self._memory_cache.move_to_end(cache_key)
+        if len(self._memory_cache) > self.memory_cache_size:
+            self._memory_cache.popitem(last=False)
+    
+    def _cache_key(self, district: str, state: str, country: str) -> str:
+        """
+        Build the cache key for a location, ignoring case and surrounding whitespace.
+        
+        Args:
+            district (str): District or city name
+            state (str): State or province name  
+            country (str): Country name
+            
+        Returns:
+            str: Location cache key
+        """
+        return "|".join(part.strip().lower() for part in (district, state, country))
+    
+    def _read_disk_cache(self, cache_key: str) -> Optional[Tuple[float, float]]:
+        """
+        Look up previously resolved coordinates in the on-disk cache.
+        
+        Args:
+            cache_key (str): Location cache key
+            
+        Returns:
+            Optional[Tuple[float, float]]: Cached coordinates if present
+        """
+        try:
+            row = _connect_cache(self.cache_path).execute(
+                "SELECT lat, lon FROM geocache WHERE key = ?", (cache_key,)
+            ).fetchone()
+            return (row[0], row[1]) if row else None
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠️ Location cache unavailable: {e}")
+            return None
+    
+    def _write_disk_cache(self, cache_key: str, coordinates: Tuple[float, float]) -> None:
+        """
+        Persist resolved coordinates to the on-disk cache.
+        
+        Args:
+            cache_key (str): Location cache key
+            coordinates (Tuple[float, float]): (latitude, longitude)
+        """
+        try:
+            connection = _connect_cache(self.cache_path)
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO geocache (key, lat, lon) VALUES (?, ?, ?)",
+                    (cache_key, coordinates[0], coordinates[1])
+                )
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠️ Could not update location cache: {e}")
+    
+    def _wait_for_rate_limit(self) -> None:
+        """
+        Block until at least request_delay seconds have passed since the last request.
+        
+        Calls that are already spaced out don't sleep at all, and concurrent
+        callers are serialized so each one gets its own slot.
+        """
+        with self._rate_limit_lock:
+            wait = self.request_delay - (time.monotonic() - self._last_request_time)
+            if wait > 0:
+                time.sleep(wait)
+            self._last_request_time = time.monotonic()
     
     def _query_nominatim(self, query: str) -> Optional[Tuple[float, float]]:
         """
@@ -67,45 +305,129 @@ class LocationResolver:
         Returns:
             Optional[Tuple[float, float]]: Coordinates if found
         """
-        params = {
-            'q': query,
-            'format': 'json',
-            'limit': 1,
-            'addressdetails': 1
-        }
-        
         try:
             # Respectful delay to avoid overwhelming the API
-            time.sleep(self.request_delay)
+            self._wait_for_rate_limit()
             
-            response = requests.get(
+            response = self.session.get(
                 self.base_url,
-                params=params,
-                headers=self.headers,
+                params=self._search_params(query),
                 timeout=10
             )
             response.raise_for_status()
             
-            data = response.json()
-            
-            if data and len(data) > 0:
-                result = data[0]
-                latitude = float(result['lat'])
-                longitude = float(result['lon'])
-                
-                # Validate coordinate ranges
-                if self._validate_coordinates(latitude, longitude):
-                    return latitude, longitude
+            return self._parse_results(response.json())
             
+        except requests.exceptions.RequestException as e:
+            print(f"⚠️ API request failed for '{query}': {e}")
             return None
+        except (KeyError, ValueError, IndexError) as e:
+            print(f"⚠️ Invalid response data for '{query}': {e}")
+            return None
+    
+    async def _aquery_nominatim(self, query: str) -> Optional[Tuple[float, float]]:
+        """
+        Asynchronously query Nominatim API for coordinates.
+        
+        Args:
+            query (str): Location search query
             
-        except requests.exceptions.RequestException as e:
+        Returns:
+            Optional[Tuple[float, float]]: Coordinates if found
+        """
+        import httpx
+        
+        self._bind_event_loop()
+        
+        try:
+            # Respectful delay to avoid overwhelming the API
+            await self._await_rate_limit()
+            
+            response = await self._async_client.get(
+                self.base_url,
+                params=self._search_params(query)
+            )
+            response.raise_for_status()
+            
+            return self._parse_results(response.json())
+            
+        except httpx.HTTPError as e:
             print(f"⚠️ API request failed for '{query}': {e}")
             return None
         except (KeyError, ValueError, IndexError) as e:
             print(f"⚠️ Invalid response data for '{query}': {e}")
             return None
     
+    def _bind_event_loop(self) -> None:
+        """
+        Create the async client and rate-limit lock for the running event loop.
+        
+        The resolver is shared across the process, so it can outlive the loop
+        its client was created on (e.g. across separate asyncio.run() calls).
+        Both are tied to that loop, so they are recreated whenever it changes.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_loop is loop:
+            return
+        
+        # httpx is only needed by the async path, so sync callers never import it
+        import httpx
+        
+        self._async_client = httpx.AsyncClient(headers=self.headers, http2=True, timeout=10)
+        self._async_rate_limit_lock = asyncio.Lock()
+        self._async_loop = loop
+    
+    async def _await_rate_limit(self) -> None:
+        """
+        Asynchronously wait until at least request_delay seconds have passed since the last request.
+        """
+        async with self._async_rate_limit_lock:
+            wait = self.request_delay - (time.monotonic() - self._last_request_time)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_request_time = time.monotonic()
+    
+    def _search_params(self, query: str) -> Dict[str, object]:
+        """
+        Build Nominatim query parameters.
+        
+        Args:
+            query (str): Location search query
+            
+        Returns:
+            Dict[str, object]: Request parameters
+        """
+        return {
+            'q': query,
+            'format': 'json',
+            'limit': 1,
+            'addressdetails': 1
+        }
+    
+    def _parse_results(self, data: list) -> Optional[Tuple[float, float]]:
+        """
+        Extract coordinates from a Nominatim search response.
+        
+        Args:
+            data (list): Decoded JSON search results
+            
+        Returns:
+            Optional[Tuple[float, float]]: Coordinates if found and valid
+            
+        Raises:
+            KeyError, ValueError, IndexError: If the response is malformed
+        """
+        if data and len(data) > 0:
+            result = data[0]
+            latitude = float(result['lat'])
+            longitude = float(result['lon'])
+            
+            # Validate coordinate ranges
+            if self._validate_coordinates(latitude, longitude):
+                return latitude, longitude
+        
+        return None
+    
     def _validate_coordinates(self, latitude: float, longitude: float) -> bool:
         """
         Validate that coordinates are within valid ranges.
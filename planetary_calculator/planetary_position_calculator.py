@@ -3,10 +3,98 @@ Planetary position calculation tool for Vedic astrology.
 Handles the integration between user input and the astrology calculation engine.
 """
 
-from typing import List, Dict, Any
+import calendar
+from collections import defaultdict
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
 from planetary_calculator.location_resolver import LocationResolver
 from planetary_calculator.vedic_calculator_engine import VedicCalculatorEngine
 
+# Valid ranges for (year, month, day, hour, minute), checked in this order
+_BIRTH_FIELD_NAMES = ("Year", "Month", "Day", "Hour", "Minute")
+_BIRTH_FIELD_BOUNDS = ((1900, 2100), (1, 12), (1, 31), (0, 23), (0, 59))
+
+@dataclass(slots=True, frozen=True)
+class PositionResult:
+    """
+    Outcome of a planetary position calculation.
+    
+    Attributes:
+        success (bool): Whether calculation was successful
+        positions (Tuple[str, ...]): Formatted planetary positions
+        error (str): Error message if calculation failed
+        location (str): Location the chart was calculated for
+        coordinates (str): Formatted latitude and longitude of that location
+    """
+    success: bool
+    positions: Tuple[str, ...] = ()
+    error: str = ""
+    location: str = ""
+    coordinates: str = ""
+    
+    def __getitem__(self, key: str) -> Any:
+        """
+        Read a field by name, for callers written against the old dict result.
+        
+        Args:
+            key (str): Field name
+            
+        Returns:
+            Any: Value of the field
+            
+        Raises:
+            KeyError: If key is not a field of the result
+        """
+        if key not in _POSITION_RESULT_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Convert the result to the dictionary shape returned by earlier versions.
+        
+        Returns:
+            Dict[str, Any]: success, positions, location and coordinates on
+            success; success and error on failure
+        """
+        if not self.success:
+            return {"success": False, "error": self.error}
+        return {
+            "success": True,
+            "positions": list(self.positions),
+            "location": self.location,
+            "coordinates": self.coordinates
+        }
+
+_POSITION_RESULT_FIELDS = frozenset(field.name for field in fields(PositionResult))
+
+@lru_cache(maxsize=1)
+def _get_engine() -> VedicCalculatorEngine:
+    """
+    Get the shared calculation engine.
+    
+    Swiss Ephemeris is configured when the engine is created, so caching it
+    means repeat calculations skip that setup.
+    
+    Returns:
+        VedicCalculatorEngine: Process-wide engine instance
+    """
+    return VedicCalculatorEngine()
+
+@lru_cache(maxsize=1)
+def _get_resolver() -> LocationResolver:
+    """
+    Get the shared location resolver.
+    
+    Reusing one resolver keeps its HTTP session, rate limiter and location
+    cache alive between calculations.
+    
+    Returns:
+        LocationResolver: Process-wide resolver instance
+    """
+    return LocationResolver()
+
 def calculate_planetary_positions(
     birth_year: str,
     birth_month: str, 
@@ -17,7 +105,7 @@ def calculate_planetary_positions(
     state: str,
     country: str,
     user_name: str = "User"
-) -> Dict[str, Any]:
+) -> PositionResult:
     """
     Calculate planetary positions for given birth details and location.
     
@@ -36,69 +124,153 @@ def calculate_planetary_positions(
         user_name (str, optional): Name of the user. Defaults to "User"
         
     Returns:
-        Dict[str, Any]: Dictionary containing:
+        PositionResult: Result containing:
             - success (bool): Whether calculation was successful
-            - positions (List[str]): Formatted planetary positions
-            - error (str, optional): Error message if calculation failed
+            - positions (Tuple[str, ...]): Formatted planetary positions
+            - error (str): Error message if calculation failed
             
     Example:
         >>> result = calculate_planetary_positions(
         ...     "1990", "5", "15", "14", "30",
         ...     "Mumbai", "Maharashtra", "India", "John"
         ... )
-        >>> print(result['positions'])
-        ['Sun      : 054° 23' → 24° 23' Taurus', ...]
+        >>> print(result.positions)
+        ('Sun      : 054° 23' → 24° 23' Taurus', ...)
     """
     try:
         # Validate and convert input parameters
-        birth_data = _validate_birth_data(
+        year, month, day, hour, minute = _validate_birth_data(
             birth_year, birth_month, birth_day, birth_hour, birth_minute
         )
         
         # Resolve location to coordinates
-        location_resolver = LocationResolver()
+        location_resolver = _get_resolver()
         coordinates = location_resolver.get_coordinates(district, state, country)
         
         if not coordinates:
-            return {
-                "success": False,
-                "error": f"Could not resolve location: {district}, {state}, {country}"
-            }
+            return PositionResult(
+                success=False,
+                error=f"Could not resolve location: {district}, {state}, {country}"
+            )
         
         latitude, longitude = coordinates
         
         # Calculate planetary positions
-        calculator = VedicCalculatorEngine()
+        calculator = _get_engine()
         planetary_positions = calculator.calculate_positions(
-            name=user_name,
-            year=birth_data['year'],
-            month=birth_data['month'],
-            day=birth_data['day'],
-            hour=birth_data['hour'],
-            minute=birth_data['minute'],
-            latitude=latitude,
-            longitude=longitude
+            user_name, year, month, day, hour, minute, latitude, longitude
         )
         
-        return {
-            "success": True,
-            "positions": planetary_positions,
-            "location": f"{district}, {state}, {country}",
-            "coordinates": f"{latitude:.4f}°, {longitude:.4f}°"
-        }
+        return PositionResult(
+            success=True,
+            positions=tuple(planetary_positions),
+            location=f"{district}, {state}, {country}",
+            coordinates=f"{latitude:.4f}°, {longitude:.4f}°"
+        )
         
     except ValueError as e:
-        return {
-            "success": False,
-            "error": f"Invalid birth data: {str(e)}"
-        }
+        return PositionResult(
+            success=False,
+            error=f"Invalid birth data: {str(e)}"
+        )
     except Exception as e:
-        return {
-            "success": False,
-            "error": f"Calculation failed: {str(e)}"
-        }
+        return PositionResult(
+            success=False,
+            error=f"Calculation failed: {str(e)}"
+        )
 
-def _validate_birth_data(year: str, month: str, day: str, hour: str, minute: str) -> Dict[str, int]:
+def calculate_planetary_positions_batch(records: List[Dict[str, str]]) -> List[PositionResult]:
+    """
+    Calculate planetary positions for many birth records at once.
+    
+    Uses one engine and one resolver for the whole batch, geocodes each
+    distinct location only once and computes all charts together. Locations
+    that can't be resolved are reported as failures instead of prompting
+    for manual coordinates.
+    
+    Args:
+        records (List[Dict[str, str]]): Birth records with the same keys as the
+            arguments of calculate_planetary_positions (birth_year, birth_month,
+            birth_day, birth_hour, birth_minute, district, state, country and
+            optionally user_name)
+            
+    Returns:
+        List[PositionResult]: One result per record, in input order, shaped like
+        the return value of calculate_planetary_positions
+    """
+    results: List[PositionResult] = [None] * len(records)
+    births = {}
+    indices_by_location = defaultdict(list)
+    
+    # Validate every record and group the valid ones by location
+    for index, record in enumerate(records):
+        try:
+            births[index] = _validate_birth_data(
+                record["birth_year"], record["birth_month"], record["birth_day"],
+                record["birth_hour"], record["birth_minute"]
+            )
+            location = (record["district"], record["state"], record["country"])
+            indices_by_location[location].append(index)
+        except ValueError as e:
+            results[index] = PositionResult(
+                success=False,
+                error=f"Invalid birth data: {str(e)}"
+            )
+        except KeyError as e:
+            results[index] = PositionResult(
+                success=False,
+                error=f"Invalid birth data: missing field {str(e)}"
+            )
+    
+    try:
+        # Resolve each distinct location once
+        location_resolver = _get_resolver()
+        chart_indices = []
+        chart_coordinates = []
+        
+        for (district, state, country), indices in indices_by_location.items():
+            # Never block a batch on input(); unresolved records just report the failure
+            coordinates = location_resolver.get_coordinates(
+                district, state, country, manual_fallback=False
+            )
+            
+            for index in indices:
+                if not coordinates:
+                    results[index] = PositionResult(
+                        success=False,
+                        error=f"Could not resolve location: {district}, {state}, {country}"
+                    )
+                else:
+                    chart_indices.append(index)
+                    chart_coordinates.append(coordinates)
+        
+        # Calculate all charts together
+        calculator = _get_engine()
+        charts = calculator.calculate_positions_batch(
+            [births[index] for index in chart_indices],
+            chart_coordinates
+        )
+        
+        for index, planetary_positions, (latitude, longitude) in zip(chart_indices, charts, chart_coordinates):
+            record = records[index]
+            results[index] = PositionResult(
+                success=True,
+                positions=tuple(planetary_positions),
+                location=f"{record['district']}, {record['state']}, {record['country']}",
+                coordinates=f"{latitude:.4f}°, {longitude:.4f}°"
+            )
+        
+    except Exception as e:
+        for index, result in enumerate(results):
+            if result is None:
+                results[index] = PositionResult(
+                    success=False,
+                    error=f"Calculation failed: {str(e)}"
+                )
+    
+    return results
+
+def _validate_birth_data(year: str, month: str, day: str, hour: str, minute: str) -> Tuple[int, int, int, int, int]:
     """
     Validate and convert birth data strings to integers.
     
@@ -106,39 +278,29 @@ def _validate_birth_data(year: str, month: str, day: str, hour: str, minute: str
         year, month, day, hour, minute (str): Birth data as strings
         
     Returns:
-        Dict[str, int]: Validated birth data as integers
+        Tuple[int, int, int, int, int]: Validated (year, month, day, hour, minute)
         
     Raises:
         ValueError: If any birth data is invalid
     """
-    try:
-        birth_data = {
-            'year': int(year),
-            'month': int(month),
-            'day': int(day),
-            'hour': int(hour),
-            'minute': int(minute)
-        }
-        
-        # Validate ranges
-        if not (1900 <= birth_data['year'] <= 2100):
-            raise ValueError(f"Year must be between 1900 and 2100, got {birth_data['year']}")
-        
-        if not (1 <= birth_data['month'] <= 12):
-            raise ValueError(f"Month must be between 1 and 12, got {birth_data['month']}")
-            
-        if not (1 <= birth_data['day'] <= 31):
-            raise ValueError(f"Day must be between 1 and 31, got {birth_data['day']}")
-            
-        if not (0 <= birth_data['hour'] <= 23):
-            raise ValueError(f"Hour must be between 0 and 23, got {birth_data['hour']}")
-            
-        if not (0 <= birth_data['minute'] <= 59):
-            raise ValueError(f"Minute must be between 0 and 59, got {birth_data['minute']}")
+    birth_data = ()
+    
+    for name, (low, high), value in zip(_BIRTH_FIELD_NAMES, _BIRTH_FIELD_BOUNDS, (year, month, day, hour, minute)):
+        # Check the text is a plain ASCII integer before converting it
+        text = str(value).strip()
+        digits = text[1:] if text.startswith(("-", "+")) else text
+        if not (digits.isascii() and digits.isdigit()):
+            raise ValueError(f"{name} must be a valid number, got {value!r}")
         
-        return birth_data
+        # Validate range
+        number = int(text)
+        if not low <= number <= high:
+            raise ValueError(f"{name} must be between {low} and {high}, got {number}")
         
-    except ValueError as e:
-        if "invalid literal" in str(e):
-            raise ValueError("All birth data must be valid numbers")
-        raise e
\ No newline at end of file
+        birth_data += (number,)
+    
+    days_in_month = calendar.monthrange(birth_data[0], birth_data[1])[1]
+    if birth_data[2] > days_in_month:
+        raise ValueError(f"Day must be between 1 and {days_in_month} for month {birth_data[1]}, got {birth_data[2]}")
+    
+    return birth_data
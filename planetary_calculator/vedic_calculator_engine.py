@@ -3,11 +3,71 @@ Core Vedic Astrology calculation engine using Swiss Ephemeris.
 Handles all astronomical calculations and astrological computations.
 """
 
+import calendar
+import numpy as np
 import swisseph as swe
-from datetime import datetime, timedelta
-from typing import List, Tuple, Dict
+from functools import lru_cache
+from typing import List, Sequence, Tuple, Dict
 from planetary_calculator.formatting_utils import PositionFormatter
 
+# Offset of Indian Standard Time (UTC+5:30) from UTC, in days
+_IST_OFFSET_DAYS = 5.5 / 24.0
+
+# Swiss Ephemeris entry points and flags bound once instead of looked up per call
+_calc = swe.calc
+_houses_ex = swe.houses_ex
+_FLG_SIDEREAL = swe.FLG_SIDEREAL
+
+def _opposite_longitude(longitude: float) -> float:
+    """
+    Longitude of the point 180° opposite, for a longitude already within 0-360.
+    
+    Args:
+        longitude (float): Longitude in degrees (0-360)
+        
+    Returns:
+        float: Opposite longitude in degrees (0-360)
+    """
+    return longitude - 180.0 if longitude >= 180.0 else longitude + 180.0
+
+# Swiss Ephemeris results only depend on their arguments once the sidereal mode
+# is fixed (Lahiri, set by the engine), so repeated charts can reuse them.
+
+@lru_cache(maxsize=4096)
+def _cached_calc(julian_day: float, planet_id: int) -> Tuple[float, ...]:
+    """
+    Sidereal position of a body, memoized by (Julian Day, body).
+    
+    Args:
+        julian_day (float): Julian Day for calculations
+        planet_id (int): Swiss Ephemeris body ID
+        
+    Returns:
+        Tuple[float, ...]: Longitude, latitude, distance and their speeds
+    """
+    return _calc(julian_day, planet_id, _FLG_SIDEREAL)[0]
+
+@lru_cache(maxsize=4096)
+def _cached_houses(
+    julian_day: float,
+    latitude: float,
+    longitude: float,
+    house_system: bytes
+) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    """
+    Sidereal house cusps and angles, memoized by time, place and house system.
+    
+    Args:
+        julian_day (float): Julian Day for calculations
+        latitude (float): Location latitude
+        longitude (float): Location longitude
+        house_system (bytes): Swiss Ephemeris house system code
+        
+    Returns:
+        Tuple[Tuple[float, ...], Tuple[float, ...]]: House cusps and ascmc points
+    """
+    return _houses_ex(julian_day, latitude, longitude, house_system, _FLG_SIDEREAL)
+
 class VedicCalculatorEngine:
     """
     Core engine for Vedic astrological calculations.
@@ -16,6 +76,8 @@ class VedicCalculatorEngine:
     configured for sidereal (Vedic) astrology with Lahiri ayanamsa.
     """
     
+    __slots__ = ("formatter", "_table_start", "_table_end", "_table_spline")
+    
     # Planetary bodies to calculate
     PLANETS = {
         swe.SUN: "Sun",
@@ -28,6 +90,19 @@ class VedicCalculatorEngine:
         swe.MEAN_NODE: "Rahu"  # North Node
     }
     
+    # Parallel tuples of PLANETS for the hot loops; Rahu is handled specially
+    _PLANET_IDS = tuple(PLANETS.keys())
+    _PLANET_NAMES = tuple(PLANETS.values())
+    _RAHU_INDEX = _PLANET_NAMES.index("Rahu")
+    
+    # Bodies in output order; Ketu follows Rahu and is derived from it
+    BODY_NAMES = _PLANET_NAMES + ("Ketu",)
+    
+    # House system for houses_ex. The Ascendant is the same in every system, and
+    # Equal houses are closed-form (Placidus iterates and fails near the poles).
+    # Override with b'P' (on the class or a subclass) if Placidus cusps are needed.
+    HOUSE_SYSTEM = b'E'
+    
     # Zodiac signs in order
     ZODIAC_SIGNS = [
         "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
@@ -38,6 +113,11 @@ class VedicCalculatorEngine:
         """Initialize the Vedic calculator with proper ephemeris settings."""
         self._setup_ephemeris()
         self.formatter = PositionFormatter(self.ZODIAC_SIGNS)
+        
+        # Optional interpolated ephemeris, populated by precompute_table()
+        self._table_start = 0.0
+        self._table_end = 0.0
+        self._table_spline = None
     
     def _setup_ephemeris(self) -> None:
         """Configure Swiss Ephemeris for Vedic astrology calculations."""
@@ -47,6 +127,60 @@ class VedicCalculatorEngine:
         # Set sidereal mode with Lahiri ayanamsa (standard for Vedic astrology)
         swe.set_sid_mode(swe.SIDM_LAHIRI)
     
+    def precompute_table(self, jd_start: float, jd_end: float, step: float = 1.0) -> None:
+        """
+        Precompute planet longitudes on a grid and interpolate them for later charts.
+        
+        Charts whose Julian Day falls inside [jd_start, jd_end] then read planet
+        positions from a cubic spline instead of calling Swiss Ephemeris. With the
+        default one-day step the interpolation error is well below an arcminute,
+        the precision of the formatted output. The ascendant is always computed
+        directly. Requires scipy.
+        
+        Args:
+            jd_start (float): First Julian Day of the table
+            jd_end (float): Last Julian Day of the table
+            step (float, optional): Grid spacing in days. Defaults to 1.0
+            
+        Raises:
+            ValueError: If the range or step is invalid
+            ImportError: If scipy is not installed
+        """
+        if step <= 0 or jd_end <= jd_start:
+            raise ValueError("precompute_table needs jd_end > jd_start and a positive step")
+        
+        from scipy.interpolate import CubicSpline
+        
+        # Grid covering the whole range, including jd_end
+        point_count = int(np.ceil((jd_end - jd_start) / step)) + 1
+        julian_day_grid = jd_start + step * np.arange(max(point_count, 4))
+        
+        table = np.empty((len(julian_day_grid), len(self._PLANET_IDS)), dtype=np.float64)
+        for index, planet_id in enumerate(self._PLANET_IDS):
+            for row, julian_day in enumerate(julian_day_grid.tolist()):
+                table[row, index] = _calc(julian_day, planet_id, _FLG_SIDEREAL)[0][0]
+        
+        # Unwrap the 360° -> 0° jumps so the spline sees continuous motion
+        unwrapped = np.degrees(np.unwrap(np.radians(table), axis=0))
+        
+        self._table_start = float(julian_day_grid[0])
+        self._table_end = float(julian_day_grid[-1])
+        self._table_spline = CubicSpline(julian_day_grid, unwrapped, axis=0)
+    
+    def _table_covers(self, julian_days: np.ndarray) -> np.ndarray:
+        """
+        Check which Julian Days can be read from the precomputed table.
+        
+        Args:
+            julian_days (np.ndarray): Julian Days to check
+            
+        Returns:
+            np.ndarray: Boolean mask, all False if no table has been precomputed
+        """
+        if self._table_spline is None:
+            return np.zeros(np.shape(julian_days), dtype=bool)
+        return (julian_days >= self._table_start) & (julian_days <= self._table_end)
+    
     def calculate_positions(
         self,
         name: str,
@@ -88,6 +222,62 @@ class VedicCalculatorEngine:
         
         return all_results
     
+    def calculate_positions_batch(
+        self,
+        births: Sequence[Tuple[int, int, int, int, int]],
+        coordinates: Sequence[Tuple[float, float]]
+    ) -> List[List[str]]:
+        """
+        Calculate planetary positions and ascendant for many charts at once.
+        
+        Args:
+            births (Sequence[Tuple[int, int, int, int, int]]): (year, month, day, hour, minute) per chart
+            coordinates (Sequence[Tuple[float, float]]): (latitude, longitude) per chart
+            
+        Returns:
+            List[List[str]]: Formatted positions for each chart, in input order
+        """
+        julian_days = np.array(
+            [self._calculate_julian_day(*birth) for birth in births],
+            dtype=np.float64
+        )
+        
+        # One column per body, filled planet by planet across all charts
+        longitude_table = np.empty((len(julian_days), len(self.BODY_NAMES)), dtype=np.float64)
+        julian_day_list = julian_days.tolist()
+        
+        # Bind hot-loop callables to locals to skip repeated global/attribute lookups
+        calc = _cached_calc
+        calculate_lunar_nodes = self._calculate_lunar_nodes
+        rahu_index = self._RAHU_INDEX
+        
+        # Charts inside the precomputed table are interpolated in one call
+        covered = self._table_covers(julian_days)
+        if covered.any():
+            interpolated = self._table_spline(julian_days[covered]) % 360.0
+            longitude_table[covered, :len(self._PLANET_IDS)] = interpolated
+            longitude_table[covered, rahu_index + 1] = (interpolated[:, rahu_index] + 180.0) % 360.0
+        
+        # Everything else goes through Swiss Ephemeris
+        remaining = [(row, julian_day_list[row]) for row in np.flatnonzero(~covered).tolist()]
+        
+        for index, planet_id in enumerate(self._PLANET_IDS):
+            if index == rahu_index:
+                for row, julian_day in remaining:
+                    longitude_table[row, index:index + 2] = calculate_lunar_nodes(julian_day, planet_id)
+            else:
+                for row, julian_day in remaining:
+                    longitude_table[row, index] = calc(julian_day, planet_id)[0]
+        
+        # Format every chart in one vectorized pass (swe.calc already returns 0-360)
+        charts = self.formatter.format_position_table(self.BODY_NAMES, longitude_table)
+        
+        calculate_ascendant = self._calculate_ascendant
+        for chart, julian_day, (latitude, longitude) in zip(charts, julian_day_list, coordinates):
+            chart.append(calculate_ascendant(julian_day, latitude, longitude))
+        
+        return charts
+    
     def _calculate_julian_day(
         self,
         year: int,
@@ -109,22 +299,15 @@ class VedicCalculatorEngine:
             Currently assumes Indian Standard Time (UTC+5:30).
             For production use, implement proper timezone detection.
         """
-        # Create local datetime
-        local_datetime = datetime(year, month, day, hour, minute)
+        # Julian Day arithmetic handles day/month rollover, but it would silently
+        # accept impossible dates like 31 February, so check the day first
+        if day > calendar.monthrange(year, month)[1]:
+            raise ValueError("day is out of range for month")
         
-        # Convert to UTC (assuming IST UTC+5:30 for now)
+        # Calculate Julian Day for the local time, then convert to UTC
+        # (assuming IST UTC+5:30 for now)
         # TODO: Implement proper timezone detection based on coordinates
-        utc_datetime = local_datetime - timedelta(hours=5, minutes=30)
-        
-        # Calculate Julian Day in UTC
-        julian_day = swe.julday(
-            utc_datetime.year,
-            utc_datetime.month, 
-            utc_datetime.day,
-            utc_datetime.hour + utc_datetime.minute / 60.0
-        )
-        
-        return julian_day
+        return swe.julday(year, month, day, hour + minute / 60.0) - _IST_OFFSET_DAYS
     
     def _calculate_planetary_positions(self, julian_day: float) -> List[str]:
         """
@@ -136,46 +319,48 @@ class VedicCalculatorEngine:
         Returns:
             List[str]: Formatted planetary positions
         """
-        results = []
+        longitudes = np.empty(len(self.BODY_NAMES), dtype=np.float64)
+        
+        # Read from the precomputed table if this chart falls inside it
+        if self._table_spline is not None and self._table_start <= julian_day <= self._table_end:
+            longitudes[:len(self._PLANET_IDS)] = self._table_spline(julian_day) % 360.0
+            longitudes[self._RAHU_INDEX + 1] = _opposite_longitude(longitudes[self._RAHU_INDEX])
+            return self.formatter.format_positions(self.BODY_NAMES, longitudes)
         
-        for planet_id, planet_name in self.PLANETS.items():
-            if planet_name == "Rahu":
+        # Bind hot-loop lookups to locals
+        calc = _cached_calc
+        rahu_index = self._RAHU_INDEX
+        
+        # Rahu is the last planet, so its Ketu pair fills the final two slots
+        for index, planet_id in enumerate(self._PLANET_IDS):
+            if index == rahu_index:
                 # Handle Rahu-Ketu calculation (lunar nodes)
-                rahu_ketu_results = self._calculate_lunar_nodes(julian_day, planet_id)
-                results.extend(rahu_ketu_results)
+                longitudes[index:index + 2] = self._calculate_lunar_nodes(julian_day, planet_id)
             else:
                 # Calculate regular planet position
-                position_data = swe.calc(julian_day, planet_id, swe.FLG_SIDEREAL)
-                longitude = position_data[0][0] % 360
-                
-                formatted_position = self.formatter.format_position(planet_name, longitude)
-                results.append(formatted_position)
+                longitudes[index] = calc(julian_day, planet_id)[0]
         
-        return results
+        # Format all bodies in one vectorized pass (swe.calc already returns 0-360)
+        return self.formatter.format_positions(self.BODY_NAMES, longitudes)
     
-    def _calculate_lunar_nodes(self, julian_day: float, rahu_id: int) -> List[str]:
+    def _calculate_lunar_nodes(self, julian_day: float, rahu_id: int) -> Tuple[float, float]:
         """
-        Calculate positions for Rahu (North Node) and Ketu (South Node).
+        Calculate longitudes for Rahu (North Node) and Ketu (South Node).
         
         Args:
             julian_day (float): Julian Day for calculations
             rahu_id (int): Swiss Ephemeris ID for Rahu (Mean Node)
             
         Returns:
-            List[str]: Formatted positions for Rahu and Ketu
+            Tuple[float, float]: Longitudes of Rahu and Ketu in degrees
         """
-        # Calculate Rahu position
-        rahu_data = swe.calc(julian_day, rahu_id, swe.FLG_SIDEREAL)
-        rahu_longitude = rahu_data[0][0] % 360
+        # Calculate Rahu position (already within 0-360)
+        rahu_longitude = _cached_calc(julian_day, rahu_id)[0]
         
         # Ketu is always exactly 180° opposite to Rahu
-        ketu_longitude = (rahu_longitude + 180) % 360
-        
-        # Format both positions
-        rahu_result = self.formatter.format_position("Rahu", rahu_longitude)
-        ketu_result = self.formatter.format_position("Ketu", ketu_longitude)
+        ketu_longitude = _opposite_longitude(rahu_longitude)
         
-        return [rahu_result, ketu_result]
+        return rahu_longitude, ketu_longitude
     
     def _calculate_ascendant(
         self,
@@ -195,15 +380,14 @@ class VedicCalculatorEngine:
             str: Formatted Ascendant position
         """
         # Calculate house cusps and additional points
-        house_cusps, ascmc = swe.houses_ex(
+        house_cusps, ascmc = _cached_houses(
             julian_day,
             latitude,
             longitude,
-            b'P',  # Placidus house system
-            swe.FLG_SIDEREAL
+            self.HOUSE_SYSTEM
         )
         
-        # Ascendant is the first element in ascmc array
-        ascendant_longitude = ascmc[0] % 360
+        # Ascendant is the first element in ascmc array (already within 0-360)
+        ascendant_longitude = ascmc[0]
         
         return self.formatter.format_position("Ascendant", ascendant_longitude)
\ No newline at end of file
@@ -1,6 +1,7 @@
 # prompts.py
 # System prompts for WhatsApp Birthday AI Agent
 
+from langchain_core.messages import SystemMessage
 from config import DATE_EXAMPLE
 
 SYSTEM_PROMPT = f"""
@@ -25,4 +26,8 @@ User: "Hi there!" → Response: "Please input your date of birth in DD-MM-YYYY f
 User: "My birthday is 25-12-1990" → Use tool and respond with result
 User: "I was born on 05-07-1985" → Use tool and respond with result
 User: "Born on 12/25/1985" → Response: "Please provide date in DD-MM-YYYY format (day-month-year). Example: {DATE_EXAMPLE}"
-"""
\ No newline at end of file
+"""
+
+# Keep the system prompt as a stable, timestamp-free prefix so OpenAI's automatic
+# prompt caching can reuse it across requests.
+SYSTEM_MESSAGE = SystemMessage(content=SYSTEM_PROMPT)
@@ -1,43 +1,67 @@
 # tools.py
 # Tools for WhatsApp Birthday AI Agent
 
-import re
-from datetime import datetime
-from langchain_core.tools import tool
+import time
+from datetime import date
+from functools import lru_cache
 from config import (
-    DATE_FORMAT, 
-    DATE_PATTERN, 
+    DATE_RE,
     FORMAT_ERROR_MESSAGE,
     BIRTHDAY_MESSAGE,
     NOT_BIRTHDAY_MESSAGE,
     INVALID_DATE_MESSAGE
 )
 
-@tool
-def check_birthday(date_of_birth: str) -> str:
+# Today's date is looked up at most once a minute: (monotonic timestamp, ordinal)
+TODAY_CACHE_TTL = 60.0
+_today_cache = (float("-inf"), 0)
+
+def _today_ordinal() -> int:
     """
-    Check if today matches the user's birthday (month and day).
+    Get today's date ordinal, refreshing it at most every TODAY_CACHE_TTL seconds.
+    
+    Returns:
+        int: Proleptic Gregorian ordinal of today's date
+    """
+    global _today_cache
+    now = time.monotonic()
+    if now - _today_cache[0] > TODAY_CACHE_TTL:
+        _today_cache = (now, date.today().toordinal())
+    return _today_cache[1]
+
+@lru_cache(maxsize=4096)
+def _check(date_of_birth: str, today_ordinal: int) -> str:
+    """
+    Compare a date of birth with the given day.
+    
+    Results only depend on the inputs, so they are memoized. Keying on the
+    ordinal of today's date makes cached entries expire at midnight.
     
     Args:
-        date_of_birth (str): User's date of birth in DD-MM-YYYY format only
+        date_of_birth (str): User's date of birth
+        today_ordinal (int): Proleptic Gregorian ordinal of today's date
     
     Returns:
-        str: Birthday message or not birthday message
+        str: Birthday message, not birthday message or an error message
     """
     try:
         # Only accept DD-MM-YYYY format (day-month-year)
         # Pattern: 1-2 digits, dash, 1-2 digits, dash, 4 digits
-        if not re.match(DATE_PATTERN, date_of_birth):
+        if not DATE_RE.match(date_of_birth):
             return FORMAT_ERROR_MESSAGE
         
-        # Parse the date in DD-MM-YYYY format
-        dob_date = datetime.strptime(date_of_birth, DATE_FORMAT)
+        # Parse the date in DD-MM-YYYY format (the regex guarantees three numeric parts)
+        day, month, year = map(int, date_of_birth.split('-'))
+        if not (1 <= month <= 12 and 1 <= day <= 31):
+            return INVALID_DATE_MESSAGE
+        
+        # Reject days that don't exist in the given month (e.g. 31-04)
+        date(year, month, day)
         
-        # Get today's date
-        today = datetime.now()
+        today = date.fromordinal(today_ordinal)
         
         # Compare month and day only
-        if dob_date.month == today.month and dob_date.day == today.day:
+        if (month, day) == (today.month, today.day):
             return BIRTHDAY_MESSAGE
         else:
             return NOT_BIRTHDAY_MESSAGE
@@ -47,5 +71,39 @@ def check_birthday(date_of_birth: str) -> str:
     except Exception as e:
         return f"Error checking birthday: {str(e)}"
 
-# List of all available tools
-TOOLS = [check_birthday]
\ No newline at end of file
+def check_birthday(date_of_birth: str) -> str:
+    """
+    Check if today matches the user's birthday (month and day).
+    
+    Args:
+        date_of_birth (str): User's date of birth in DD-MM-YYYY format only
+    
+    Returns:
+        str: Birthday message or not birthday message
+    """
+    try:
+        return _check(date_of_birth, _today_ordinal())
+    except TypeError as e:
+        # Unhashable input can't be used as a cache key
+        return f"Error checking birthday: {str(e)}"
+
+@lru_cache(maxsize=1)
+def get_tools() -> list:
+    """
+    Get the LangChain tools for the agent.
+    
+    langchain_core is imported here rather than at module load, so code that
+    only calls check_birthday directly never pays for it.
+    
+    Returns:
+        list: List of all available tools
+    """
+    from langchain_core.tools import tool
+    
+    return [tool(check_birthday)]
+
+def __getattr__(name: str):
+    """Keep `from tools import TOOLS` working; the list is built on first access."""
+    if name == "TOOLS":
+        return get_tools()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")